@@ -15,14 +15,35 @@ pub fn criterion_benchmark(c: &mut Criterion) {
     c.bench_function("ml_kem_512 KeyGen", |b| b.iter(|| ml_kem_512::KG::try_keygen_vt()));
     c.bench_function("ml_kem_512 Encaps", |b| b.iter(|| ek_512.try_encaps_vt()));
     c.bench_function("ml_kem_512 Decaps", |b| b.iter(|| dk_512.try_decaps_vt(&ct_512)));
+    c.bench_function("ml_kem_512 RoundTrip", |b| {
+        b.iter(|| {
+            let (ek, dk) = ml_kem_512::KG::try_keygen_vt().unwrap();
+            let (ssk1, ct) = ek.try_encaps_vt().unwrap();
+            dk.try_decaps_vt(&ct).unwrap() == ssk1
+        })
+    });
 
     c.bench_function("ml_kem_768 KeyGen", |b| b.iter(|| ml_kem_768::KG::try_keygen_vt()));
     c.bench_function("ml_kem_768 Encaps", |b| b.iter(|| ek_768.try_encaps_vt()));
     c.bench_function("ml_kem_768 Decaps", |b| b.iter(|| dk_768.try_decaps_vt(&ct_768)));
+    c.bench_function("ml_kem_768 RoundTrip", |b| {
+        b.iter(|| {
+            let (ek, dk) = ml_kem_768::KG::try_keygen_vt().unwrap();
+            let (ssk1, ct) = ek.try_encaps_vt().unwrap();
+            dk.try_decaps_vt(&ct).unwrap() == ssk1
+        })
+    });
 
     c.bench_function("ml_kem_1024 KeyGen", |b| b.iter(|| ml_kem_1024::KG::try_keygen_vt()));
     c.bench_function("ml_kem_1024 Encaps", |b| b.iter(|| ek_1024.try_encaps_vt()));
     c.bench_function("ml_kem_1024 Decaps", |b| b.iter(|| dk_1024.try_decaps_vt(&ct_1024)));
+    c.bench_function("ml_kem_1024 RoundTrip", |b| {
+        b.iter(|| {
+            let (ek, dk) = ml_kem_1024::KG::try_keygen_vt().unwrap();
+            let (ssk1, ct) = ek.try_encaps_vt().unwrap();
+            dk.try_decaps_vt(&ct).unwrap() == ssk1
+        })
+    });
 }
 
 criterion_group!(benches, criterion_benchmark);
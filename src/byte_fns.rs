@@ -64,10 +64,24 @@ use crate::types::Z256;
 pub(crate) fn byte_encode(
     d: u32, integers_f: &[Z256; 256], bytes_b: &mut [u8],
 ) -> Result<(), &'static str> {
+    if d == 12 {
+        // Fast path for the serialization of ek, dk, t_hat and s_hat: every two 12-bit
+        // coefficients pack into exactly 3 bytes, so write them directly without the bit accumulator.
+        ensure!(bytes_b.len() == 384, "Alg4: bytes length not 32 * 12");
+        ensure!(integers_f.iter().all(|e| e.get_u16() <= Q as u16), "Alg4: Coeff out of range");
+        for (ints, bytes) in integers_f.chunks_exact(2).zip(bytes_b.chunks_exact_mut(3)) {
+            let (c0, c1) = (ints[0].get_u16() & 0x0FFF, ints[1].get_u16() & 0x0FFF);
+            bytes[0] = c0 as u8;
+            bytes[1] = ((c0 >> 8) | (c1 << 4)) as u8;
+            bytes[2] = (c1 >> 4) as u8;
+        }
+        return Ok(());
+    }
+
     let mut temp = 0u64;
     let mut bit_index = 0;
     let mut byte_index = 0;
-    let m = if d < 12 { 2u64.pow(d) } else { Q as u64 };
+    let m = 2u64.pow(d);
     for coeff in integers_f {
         let coeff = coeff.get_u16() as u64; //% Q as u16) as u64;
         ensure!(coeff <= m, "Alg4: Coeff out of range");
@@ -137,19 +151,30 @@ pub(crate) fn byte_encode(
 pub(crate) fn byte_decode(
     d: u32, bytes_b: &[u8], integers_f: &mut [Z256; 256],
 ) -> Result<(), &'static str> {
-    let bitlen = d;
-    let mut temp = 0u64;
-    let mut int_index = 0;
-    let mut bit_index = 0;
-    for byte in bytes_b {
-        temp |= (*byte as u64) << bit_index;
-        bit_index += 8;
-        while bit_index >= bitlen {
-            let tmask = temp & (2u64.pow(bitlen) - 1);
-            integers_f[int_index] = Z256(tmask as u16);
-            bit_index -= bitlen;
-            temp >>= bitlen;
-            int_index += 1;
+    if d == 12 {
+        // Fast path for the (de)serialization of ek, dk, t_hat and s_hat: every 3 bytes hold
+        // exactly two 12-bit coefficients, so unpack them directly without the bit accumulator.
+        ensure!(bytes_b.len() == 384, "Alg5: bytes length not 32 * 12");
+        for (bytes, ints) in bytes_b.chunks_exact(3).zip(integers_f.chunks_exact_mut(2)) {
+            let (b0, b1, b2) = (bytes[0] as u16, bytes[1] as u16, bytes[2] as u16);
+            ints[0] = Z256(b0 | ((b1 & 0x0F) << 8));
+            ints[1] = Z256((b1 >> 4) | (b2 << 4));
+        }
+    } else {
+        let bitlen = d;
+        let mut temp = 0u64;
+        let mut int_index = 0;
+        let mut bit_index = 0;
+        for byte in bytes_b {
+            temp |= (*byte as u64) << bit_index;
+            bit_index += 8;
+            while bit_index >= bitlen {
+                let tmask = temp & (2u64.pow(bitlen) - 1);
+                integers_f[int_index] = Z256(tmask as u16);
+                bit_index -= bitlen;
+                temp >>= bitlen;
+                int_index += 1;
+            }
         }
     }
     let max = if d < 12 { 2u16.pow(d) } else { Q as u16 };
@@ -231,6 +256,13 @@ mod tests {
             byte_encode(11, &integer_array, &mut bytes2).unwrap();
             assert_eq!(bytes1, bytes2);
 
+            let mut integers1 = [Z256(0); 256];
+            integers1.iter_mut().for_each(|x| x.0 = rng.gen::<u16>() % 3329);
+            let mut bytes1 = vec![0u8; 32 * 12];
+            byte_encode(12, &integers1, &mut bytes1).unwrap();
+            byte_decode(12, &bytes1, &mut integer_array).unwrap();
+            assert!(integers1.iter().zip(integer_array.iter()).all(|(a, b)| a.0 == b.0));
+
             let num_bytes = 32 * 10;
             let bytes1: Vec<u8> = (0..num_bytes).map(|_| rng.gen()).collect();
             let mut bytes2 = vec![0u8; num_bytes];
@@ -18,17 +18,13 @@ macro_rules! ensure {
 pub(crate) use ensure; // make available throughout crate
 
 /// Vector addition; See bottom of page 9, second row: `z_hat` = `u_hat` + `v_hat`
-#[must_use]
-pub(crate) fn vec_add<const K: usize>(
-    vec_a: &[[Z256; 256]; K], vec_b: &[[Z256; 256]; K],
-) -> [[Z256; 256]; K] {
-    let mut result = [[Z256(0); 256]; K];
+/// The sum is accumulated in place into `vec_a` rather than into a fresh result vector.
+pub(crate) fn vec_add<const K: usize>(vec_a: &mut [[Z256; 256]; K], vec_b: &[[Z256; 256]; K]) {
     for i in 0..vec_a.len() {
         for j in 0..vec_a[i].len() {
-            result[i][j] = vec_a[i][j].add(vec_b[i][j]);
+            vec_a[i][j] = vec_a[i][j].add(vec_b[i][j]);
         }
     }
-    result
 }
 
 
@@ -150,26 +146,20 @@ pub(crate) fn j(bytes: &[&[u8]]) -> [u8; 32] {
 }
 
 
-// BitRev7(i) from page 21 line 839-840 -- REMOVED DUE TO ZETA_TABLE IN ntt.rs
-
-
-/// Round to nearest  TODO: refine/optimize
-fn nearest(numerator: u32, denominator: u32) -> u16 {
-    let remainder = numerator % denominator;
-    let quotient = u16::try_from(numerator / denominator).unwrap();
-    if (2 * remainder) >= denominator {
-        quotient + 1
-    } else {
-        quotient
-    }
-}
+// BitRev7(i) from page 21 line 839-840 -- REMOVED DUE TO ZETA_TABLE/GAMMA_TABLE IN ntt.rs
 
 
 /// Compress<d> from page 18 (4.5).
 /// x → ⌈(2^d/q) · x⌋
 pub(crate) fn compress(d: u32, inout: &mut [Z256]) {
+    // ⌈n/q⌋ = ⌊(2n + q) / 2q⌋, and the division by the constant 2q is replaced by a multiply
+    // with its precomputed reciprocal and a shift (exact for all x < q and d ≤ 11).
+    const SHIFT: u32 = 34;
+    const M: u64 = ((1 << SHIFT) + 2 * Q as u64 - 1) / (2 * Q as u64);
+    debug_assert!(d < 12);
     for x_ref in &mut *inout {
-        x_ref.0 = nearest(2u32.pow(d) * u32::from(x_ref.0), Q);
+        let numerator = (u64::from(x_ref.0) << (d + 1)) + Q as u64;
+        x_ref.0 = ((numerator * M) >> SHIFT) as u16;
     }
 }
 
@@ -177,7 +167,35 @@ pub(crate) fn compress(d: u32, inout: &mut [Z256]) {
 /// Decompress<d> from page 18 (4.6).
 /// y → ⌈(q/2^d) · y⌋ .
 pub(crate) fn decompress(d: u32, inout: &mut [Z256]) {
+    // The divisor is a power of two, so rounding to nearest is an add and a shift.
     for y_ref in &mut *inout {
-        y_ref.0 = nearest(Q * u32::from(y_ref.0), 2u32.pow(d));
+        y_ref.0 = ((Q * u32::from(y_ref.0) + (1 << (d - 1))) >> d) as u16;
+    }
+}
+
+
+#[cfg(test)]
+mod tests {
+    use crate::helpers::{compress, decompress};
+    use crate::types::Z256;
+    use crate::Q;
+
+    #[test]
+    fn test_compress_and_decompress() {
+        for d in [1, 4, 5, 10, 11] {
+            for x in 0..Q {
+                // Reference rounding per section 4.5, using integer division
+                let mut x_ref = [Z256(x as u16)];
+                compress(d, &mut x_ref);
+                let (quot, rem) = ((x << d) / Q, (x << d) % Q);
+                assert_eq!(u32::from(x_ref[0].0), if 2 * rem >= Q { quot + 1 } else { quot });
+            }
+            for y in 0..(1 << d) {
+                let mut y_ref = [Z256(y as u16)];
+                decompress(d, &mut y_ref);
+                let (quot, rem) = ((Q * y) >> d, (Q * y) % (1 << d));
+                assert_eq!(u32::from(y_ref[0].0), if 2 * rem >= (1 << d) { quot + 1 } else { quot });
+            }
+        }
     }
 }
@@ -30,69 +30,60 @@ pub fn k_pke_key_gen<const K: usize, const ETA1: usize, const ETA1_64: usize>(
 
     // 3: 3: N ← 0
     let mut n = 0;
-    let mut a_hat = [[[Z256(0); 256]; K]; K];
 
     // 4: for (i ← 0; i < k; i++)        ▷ generate matrix A ∈ (Z^{256}_q)^{k×k}
-    #[allow(clippy::needless_range_loop)]
-    for i in 0..K {
+    // (each entry is built in place via from_fn, so the matrix is never zero-filled beforehand)
+    let a_hat: [[[Z256; 256]; K]; K] = core::array::from_fn(|i| {
         //
         // 5: for (j ← 0; j < k; j++)
-        #[allow(clippy::needless_range_loop)]
-        for j in 0..K {
+        core::array::from_fn(|j| {
             //
             // 6: A_hat[i, j] ← SampleNTT(XOF(ρ, i, j))     ▷ each entry of Â uniform in NTT domain
             // See page 21 regarding transpose of i, j -? j, i in XOF() https://csrc.nist.gov/files/pubs/fips/203/ipd/docs/fips-203-initial-public-comments-2023.pdf
-            a_hat[i][j] = sample_ntt(xof(&rho, u8::try_from(j).unwrap(), u8::try_from(i).unwrap()));
+            sample_ntt(xof(&rho, u8::try_from(j).unwrap(), u8::try_from(i).unwrap()))
             //
-        } // 7: end for
-    } // 8: end for
+        }) // 7: end for
+    }); // 8: end for
 
-    let mut s = [[Z256(0); 256]; K];
+    // s and e are sampled straight into s_hat and e_hat, which the NTT then transforms in place
+    let mut s_hat = [[Z256(0); 256]; K];
 
     // 9: for (i ← 0; i < k; i ++)          ▷ generate s ∈ (Z_q^{256})^k
     #[allow(clippy::needless_range_loop)]
     for i in 0..K {
         //
         // 10: s[i] ← SamplePolyCBDη1(PRFη1(σ, N))     ▷ s[i] ∈ Z^{256}_q sampled from CBD
-        s[i] = sample_poly_cbd(ETA1 as u32, &prf::<ETA1_64>(&sigma, n))?;
+        s_hat[i] = sample_poly_cbd::<ETA1>(&prf::<ETA1_64>(&sigma, n))?;
 
         // 11: N ← N +1
         n += 1;
         //
     } // 12: end for
 
-    let mut e = [[Z256(0); 256]; K];
+    let mut e_hat = [[Z256(0); 256]; K];
 
     // 13: for (i ← 0; i < k; i++)                     ▷ generate e ∈ (Z_q^{256})^k
     #[allow(clippy::needless_range_loop)]
     for i in 0..K {
         //
         // 14: e[i] ← SamplePolyCBDη1(PRFη1(σ, N))     ▷ e[i] ∈ Z^{256}_q sampled from CBD
-        e[i] = sample_poly_cbd(ETA1 as u32, &prf::<ETA1_64>(&sigma, n))?;
+        e_hat[i] = sample_poly_cbd::<ETA1>(&prf::<ETA1_64>(&sigma, n))?;
 
         // 15: N ← N +1
         n += 1;
         //
     } // 16: end for
 
-    let mut s_hat = [[Z256(0); 256]; K];
-
     // 17: s_hat ← NTT(s)       ▷ NTT is run k times (once for each coordinate of s)
-    #[allow(clippy::needless_range_loop)]
-    for i in 0..K {
-        s_hat[i] = ntt(&s[i]);
-    }
-    let mut e_hat = [[Z256(0); 256]; K];
+    s_hat.iter_mut().for_each(ntt);
 
     // 18: ê ← NTT(e)           ▷ NTT is run k times
-    for i in 0..K {
-        e_hat[i] = ntt(&e[i]);
-    }
+    e_hat.iter_mut().for_each(ntt);
 
 
     // 19: t̂ ← Â ◦ ŝ + ê
-    let as_hat = mat_vec_mul(&a_hat, &s_hat);
-    let t_hat = vec_add(&as_hat, &e_hat);
+    let mut t_hat = mat_vec_mul(&a_hat, &s_hat);
+    vec_add(&mut t_hat, &e_hat);
 
     // 20: ek_{PKE} ← ByteEncode12(t̂)∥ρ        ▷ ByteEncode12 is run k times; include seed for Â
     for i in 0..K {
@@ -146,31 +137,28 @@ pub(crate) fn k_pke_encrypt<
     // 3: 3: ρ ← ekPKE [384k : 384k + 32]           ▷ extract 32-byte seed from ekPKE
     let mut rho = [0u8; 32];
     rho.copy_from_slice(&ek[384 * K..(384 * K + 32)]);
-    let mut a_hat = [[[Z256(0); 256]; K]; K];
 
     // 4: for (i ← 0; i < k; i++)      ▷ re-generate matrix A_hat(Z_q{256})^{k×k}
-    #[allow(clippy::needless_range_loop)]
-    for i in 0..K {
+    let a_hat: [[[Z256; 256]; K]; K] = core::array::from_fn(|i| {
         //
         // 5: for (j ← 0; j < k; j++)
-        #[allow(clippy::needless_range_loop)]
-        for j in 0..K {
+        core::array::from_fn(|j| {
             //
             // 6: Â[i, j] ← SampleNTT(XOF(ρ, i, j))
-
-            a_hat[i][j] = sample_ntt(xof(&rho, u8::try_from(j).unwrap(), u8::try_from(i).unwrap()));
+            sample_ntt(xof(&rho, u8::try_from(j).unwrap(), u8::try_from(i).unwrap()))
             //
-        } // 7: end for
-    } // 8: end for
+        }) // 7: end for
+    }); // 8: end for
 
-    let mut r = [[Z256(0); 256]; K];
+    // r is sampled straight into r_hat, which the NTT then transforms in place
+    let mut r_hat = [[Z256(0); 256]; K];
 
     // 9: for (i ← 0; i < k; i ++)
     #[allow(clippy::needless_range_loop)]
     for i in 0..K {
         //
         // 10: r[i] ← SamplePolyCBDη 1 (PRFη 1 (r, N))      ▷ r[i] ∈ Z^{256}_q sampled from CBD
-        r[i] = sample_poly_cbd(ETA1 as u32, &prf::<ETA1_64>(randomness, n))?;
+        r_hat[i] = sample_poly_cbd::<ETA1>(&prf::<ETA1_64>(randomness, n))?;
 
         // 11: N ← N +1
         n += 1;
@@ -184,7 +172,7 @@ pub(crate) fn k_pke_encrypt<
     for i in 0..K {
         //
         // 14: e1 [i] ← SamplePolyCBDη2(PRFη2(r, N))        ▷ e1 [i] ∈ Z^{256}_q sampled from CBD
-        e1[i] = sample_poly_cbd(ETA2 as u32, &prf::<ETA2_64>(randomness, n))?;
+        e1[i] = sample_poly_cbd::<ETA2>(&prf::<ETA2_64>(randomness, n))?;
 
         // 15: N ← N +1
         n += 1;
@@ -192,21 +180,15 @@ pub(crate) fn k_pke_encrypt<
     } // 16: end for
 
     // 17: 17: e2 ← SamplePolyCBDη(PRFη2(r, N))     ▷ sample e2 ∈ Z^{256}_q from CBD
-    let e2 = sample_poly_cbd(ETA2 as u32, &prf::<ETA2_64>(randomness, n))?;
+    let e2 = sample_poly_cbd::<ETA2>(&prf::<ETA2_64>(randomness, n))?;
 
     // 18: 18: r̂ ← NTT(r)              ▷ NTT is run k times
-    let mut r_hat = [[Z256(0); 256]; K];
-    for i in 0..K {
-        r_hat[i] = ntt(&r[i]);
-    }
+    r_hat.iter_mut().for_each(ntt);
 
     // 19: u ← NTT−1 (Â⊺ ◦ r̂) + e1
     let mut u = mat_t_vec_mul(&a_hat, &r_hat);
-    #[allow(clippy::needless_range_loop)]
-    for i in 0..K {
-        u[i] = ntt_inv(&u[i]);
-    }
-    u = vec_add(&u, &e1);
+    u.iter_mut().for_each(ntt_inv);
+    vec_add(&mut u, &e1);
 
     // 20: µ ← Decompress1(ByteDecode1(m)))
     let mut mu = [Z256(0); 256];
@@ -214,8 +196,11 @@ pub(crate) fn k_pke_encrypt<
     decompress(1, &mut mu);
 
     // 21: v ← NTT−1 (t̂⊺ ◦ r̂) + e2 + µ        ▷ encode plaintext m into polynomial v.
-    let mut v = ntt_inv(&dot_t_prod(&t_hat, &r_hat));
-    v = vec_add(&vec_add(&[v], &[e2]), &[mu])[0];
+    let mut v = dot_t_prod(&t_hat, &r_hat);
+    ntt_inv(&mut v);
+    for i in 0..256 {
+        v[i] = v[i].add(e2[i]).add(mu[i]);
+    }
 
     // 22: c1 ← ByteEncode_{du}(Compress_{du}(u))       ▷ ByteEncodedu is run k times
     let step = 32 * DU;
@@ -269,24 +254,18 @@ pub(crate) fn k_pke_decrypt<const K: usize, const DU: usize, const DV: usize>(
     }
 
     // 6: w ← v − NTT−1 (ŝ⊺ ◦ NTT(u))           ▷ NTT−1 and NTT invoked k times
-    let mut w = [Z256(0); 256];
-    let mut ntt_u = [[Z256(0); 256]; K];
-    #[allow(clippy::needless_range_loop)]
-    for i in 0..K {
-        ntt_u[i] = ntt(&u[i]);
-    }
-    let st_ntt_u = dot_t_prod(&s_hat, &ntt_u);
-    for _i in 0..K {
-        let yy = ntt_inv(&st_ntt_u);
-        for i in 0..256 {
-            w[i] = v[i].sub(yy[i]);
-        }
+    // (u is transformed in place and w is accumulated into v, as neither input is needed after)
+    u.iter_mut().for_each(ntt);
+    let mut yy = dot_t_prod(&s_hat, &u);
+    ntt_inv(&mut yy);
+    for i in 0..256 {
+        v[i] = v[i].sub(yy[i]);
     }
 
     // 7: m ← ByteEncode1 (Compress1 (w))       ▷ decode plaintext m from polynomial v
-    compress(1, &mut w);
+    compress(1, &mut v);
     let mut m = [0u8; 32];
-    byte_encode(1, &w, &mut m)?;
+    byte_encode(1, &v, &mut m)?;
 
     // 8: return m
     Ok(m)
@@ -90,9 +90,9 @@ macro_rules! functionality {
     () => {
         const ETA1_64: usize = ETA1 * 64;  // Currently, Rust does not allow expressions involving constants...
         const ETA2_64: usize = ETA2 * 64;  // ...so these are handled manually.
-        const J_LEN: usize = 32 + 32 * (DU * K + DV);
 
         use crate::byte_fns::byte_decode;
+        use crate::helpers::h;
         use crate::ml_kem::{ml_kem_decaps, ml_kem_encaps, ml_kem_key_gen};
         use crate::traits::{Decaps, Encaps, KeyGen, SerDes};
         use crate::types::Z256;
@@ -101,8 +101,10 @@ macro_rules! functionality {
         use zeroize::{Zeroize, ZeroizeOnDrop};
 
         /// Correctly sized encapsulation key specific to the target security parameter set.
+        /// The hash `H(ek)` is computed once when the key is constructed and carried alongside it,
+        /// so repeated encapsulations against a long-lived key do not rehash it.
         #[derive(Clone, Zeroize, ZeroizeOnDrop)]
-        pub struct EncapsKey([u8; EK_LEN]);
+        pub struct EncapsKey([u8; EK_LEN], [u8; 32]);
 
         /// Correctly sized decapsulation key specific to the target security parameter set.
         #[derive(Clone, Zeroize, ZeroizeOnDrop)]
@@ -129,7 +131,10 @@ macro_rules! functionality {
             ) -> Result<(EncapsKey, DecapsKey), &'static str> {
                 let (mut ek, mut dk) = ([0u8; EK_LEN], [0u8; DK_LEN]);
                 ml_kem_key_gen::<K, ETA1, ETA1_64>(rng, &mut ek, &mut dk)?;
-                Ok((EncapsKey(ek), DecapsKey(dk)))
+                // dk ends with H(ek) || z, so reuse the hash already computed by keygen
+                let mut h_ek = [0u8; 32];
+                h_ek.copy_from_slice(&dk[DK_LEN - 64..DK_LEN - 32]);
+                Ok((EncapsKey(ek, h_ek), DecapsKey(dk)))
             }
         }
 
@@ -142,7 +147,7 @@ macro_rules! functionality {
             ) -> Result<(Self::SharedSecretKey, Self::CipherText), &'static str> {
                 let mut ct = [0u8; CT_LEN];
                 let ssk = ml_kem_encaps::<K, ETA1, ETA1_64, ETA2, ETA2_64, DU, DV>(
-                    rng, &self.0, &mut ct,
+                    rng, &self.0, &self.1, &mut ct,
                 )?;
                 Ok((ssk, CipherText(ct)))
             }
@@ -153,7 +158,7 @@ macro_rules! functionality {
             type SharedSecretKey = SharedSecretKey;
 
             fn try_decaps_vt(&self, ct: &CipherText) -> Result<SharedSecretKey, &'static str> {
-                let ssk = ml_kem_decaps::<K, ETA1, ETA1_64, ETA2, ETA2_64, DU, DV, J_LEN, CT_LEN>(
+                let ssk = ml_kem_decaps::<K, ETA1, ETA1_64, ETA2, ETA2_64, DU, DV, CT_LEN>(
                     &self.0, &ct.0,
                 );
                 ssk
@@ -169,7 +174,8 @@ macro_rules! functionality {
                 for i in 0..K {
                     byte_decode(12, &ek[384 * i..384 * (i + 1)], &mut ek_hat)?;
                 }
-                Ok(EncapsKey(ek))
+                let h_ek = h(&ek);
+                Ok(EncapsKey(ek, h_ek))
             }
 
             fn into_bytes(self) -> Self::ByteArray { self.0 }
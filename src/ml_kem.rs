@@ -1,6 +1,6 @@
 use rand_core::CryptoRngCore;
 
-use crate::byte_fns::{byte_decode, byte_encode};
+use crate::byte_fns::byte_decode;
 use crate::helpers::{ensure, g, h, j};
 use crate::k_pke::k_pke_decrypt;
 use crate::types::Z256;
@@ -51,34 +51,35 @@ pub(crate) fn ml_kem_encaps<
     const DU: usize,
     const DV: usize,
 >(
-    rng: &mut impl CryptoRngCore, ek: &[u8], ct: &mut [u8],
+    rng: &mut impl CryptoRngCore, ek: &[u8], h_ek: &[u8; 32], ct: &mut [u8],
 ) -> Result<SharedSecretKey, &'static str> {
     // Validated input: encapsulation key ek ∈ B^{384k+32}
+    // Precomputed input: h_ek = H(ek), cached alongside the key so it is not rehashed per call
     // Output: shared key K ∈ B^{32}
     // Output: ciphertext c ∈ B^{32(du k+dv)}
     ensure!(ek.len() == 384 * K + 32, "Alg16: ek len not 384 * K + 32"); // type check: array of length 384k + 32
 
     // modulus check: perform the computation ek ← ByteEncode12 (ByteDecode12(ek_tidle)
-    // note: after checking, we run with the original input (due to const array allocation); the last 32 bytes is rho  // TODO: revisit
+    // note: ByteEncode12(ByteDecode12(ek_tilde)) == ek_tilde exactly when every 12-bit coefficient
+    // is below q, which byte_decode already enforces, so the re-encode and compare are skipped
     let mut ek_hat = [Z256(0); 256];
     for i in 0..K {
-        let mut ek_tilde = [0u8; 384];
-        byte_decode(12, &ek[384 * i..384 * (i + 1)], &mut ek_hat)?;
-        byte_encode(12, &ek_hat, &mut ek_tilde)?;
-        ensure!(ek_tilde == ek[384 * i..384 * (i + 1)], "Alg16: len check!");
+        byte_decode(12, &ek[384 * i..384 * (i + 1)], &mut ek_hat)
+            .map_err(|_| "Alg16: ek modulus check failed")?;
     }
 
     // 1: m ←− B32          ▷ m is 32 random bytes (see Section 3.3)
     let mut m = [0u8; 32];
-    rng.fill_bytes(&mut m); //random::<[u8; 32]>();
+    rng.try_fill_bytes(&mut m)
+        .map_err(|_| "Alg16: random number generator failed")?;
 
     // 2: (K, r) ← G(m∥H(ek))       ▷ derive shared secret key K and randomness r
-    let h_ek = h(ek);
+    debug_assert_eq!(h_ek, &h(ek));
     // let mut g_input = [0u8; 64];
     // g_input[0..32].copy_from_slice(&m);
     // g_input[32..64].copy_from_slice(&h_ek);
     // let (k, r) = g(&g_input);
-    let (k, r) = g(&[&m, &h_ek]);
+    let (k, r) = g(&[&m, h_ek]);
 
     // 3: 3: c ← K-PKE.Encrypt(ek, m, r)        ▷ encrypt m using K-PKE with randomness r
     k_pke_encrypt::<K, ETA1, ETA1_64, ETA2, ETA2_64, DU, DV>(ek, &m, &r, ct)?;
@@ -99,7 +100,6 @@ pub(crate) fn ml_kem_decaps<
     const ETA2_64: usize,
     const DU: usize,
     const DV: usize,
-    const J_LEN: usize,
     const CT_LEN: usize,
 >(
     dk: &[u8], ct: &[u8],
@@ -141,11 +141,7 @@ pub(crate) fn ml_kem_decaps<
     // g_input[32..64].copy_from_slice(h);
     let (mut k_prime, r_prime) = g(&[&m_prime, &h]);
 
-    // 7: K̄ ← J(z∥c, 32)
-    let mut j_input = [0u8; J_LEN];
-    debug_assert_eq!(j_input.len(), 32 + ct.len());
-    j_input[0..32].copy_from_slice(z);
-    j_input[32..32 + ct.len()].copy_from_slice(ct);
+    // 7: K̄ ← J(z∥c, 32)     (J absorbs z and c in turn, so no concatenated copy is built)
     let k_bar = j(&[&z, &ct]);
 
     // 8: c′ ← K-PKE.Encrypt(ekPKE , m′ , r′ )      ▷ re-encrypt using the derived randomness r′
@@ -154,9 +150,9 @@ pub(crate) fn ml_kem_decaps<
         ek_pke,
         &m_prime,
         &r_prime,
-        &mut c_prime[0..ct.len()],
+        &mut c_prime,
     )?;
-    if *ct != c_prime[0..ct.len()] {
+    if ct != c_prime {
         k_prime = k_bar;
     };
 
@@ -2,15 +2,12 @@ use crate::types::Z256;
 use crate::{Q, ZETA};
 
 /// Algorithm 8 `NTT(f)` on page 22.
-/// Computes the NTT representation `f_hat` of the given polynomial f ∈ `R_q`.
-#[must_use]
+/// Computes the NTT representation `f_hat` of the given polynomial f ∈ `R_q`, in place.
 #[allow(clippy::module_name_repetitions)]
-pub fn ntt(array_f: &[Z256; 256]) -> [Z256; 256] {
+pub fn ntt(f_hat: &mut [Z256; 256]) {
     // Input: array f ∈ Z^{256}_q           ▷ the coeffcients of the input polynomial
     // Output: array f_hat ∈ Z^{256}_q      ▷ the coeffcients of the NTT of the input polynomial
-    // 1: f_hat ← f                         ▷ will compute NTT in-place on a copy of input array
-    let mut f_hat = [Z256(0); 256];
-    f_hat.copy_from_slice(array_f);
+    // 1: f_hat ← f                         ▷ computed in place; callers no longer need f
 
     // 2: k ← 1
     let mut k = 1;
@@ -21,8 +18,8 @@ pub fn ntt(array_f: &[Z256; 256]) -> [Z256; 256] {
         // 4: for (start ← 0; start < 256; start ← start + 2 · len)
         for start in (0..256).step_by(2 * len) {
             //
-            // 5: zeta ← ζ^{BitRev7 (k)} mod q
-            let zeta = Z256(ZETA_TABLE[k << 1]);
+            // 5: zeta ← ζ^{BitRev7 (k)} mod q       (held in Montgomery form)
+            let zeta = Z256(ZETA_TABLE[k]);
 
 
             // 6: k ← k+1
@@ -32,7 +29,7 @@ pub fn ntt(array_f: &[Z256; 256]) -> [Z256; 256] {
             for j in start..(start + len) {
                 //
                 // 8: t ← zeta · f_hat[ j + len]           ▷ steps 8-10 done modulo q
-                let t = f_hat[j + len].mul(zeta);
+                let t = f_hat[j + len].mul_mont(zeta);
 
                 // 9: f_hat[ j + len] ← f_hat [ j] − t
                 f_hat[j + len] = f_hat[j].sub(t);
@@ -44,21 +41,19 @@ pub fn ntt(array_f: &[Z256; 256]) -> [Z256; 256] {
         } // 12: end for
     } // 13: end for
 
-    f_hat // 14: return f_hat
+    // 14: return f_hat  (the input array now holds f_hat)
 }
 
 
 /// Algorithm 9 `NTTinv(f)` on page 23.
-/// Computes the polynomial f ∈ `R_q` corresponding to the given NTT representation `f_hat` ∈ `T_q`.
-#[must_use]
+/// Computes the polynomial f ∈ `R_q` corresponding to the given NTT representation `f_hat` ∈ `T_q`,
+/// in place.
 #[allow(clippy::module_name_repetitions)]
-pub fn ntt_inv(f_hat: &[Z256; 256]) -> [Z256; 256] {
+pub fn ntt_inv(f: &mut [Z256; 256]) {
     // Input: array f_hat ∈ Z^{256}     ▷ the coeffcients of input NTT representation
     // Output: array f ∈ Z^{256}        ▷ the coeffcients of the inverse-NTT of the input
 
-    // 1: f ← f_hat                     ▷ will compute in-place on a copy of input array
-    let mut f: [Z256; 256] = [Z256(0); 256];
-    f.copy_from_slice(f_hat);
+    // 1: f ← f_hat                     ▷ computed in place; callers no longer need f_hat
 
     // 2: k ← 127
     let mut k = 127;
@@ -69,8 +64,8 @@ pub fn ntt_inv(f_hat: &[Z256; 256]) -> [Z256; 256] {
         // 4: for (start ← 0; start < 256; start ← start + 2 · len)
         for start in (0..256).step_by(2 * len) {
             //
-            // 5: zeta ← ζ^{BitRev7(k)} mod q
-            let zeta = Z256(ZETA_TABLE[k << 1]);
+            // 5: zeta ← ζ^{BitRev7(k)} mod q        (held in Montgomery form)
+            let zeta = Z256(ZETA_TABLE[k]);
 
             // 6: k ← k − 1
             k -= 1;
@@ -85,17 +80,17 @@ pub fn ntt_inv(f_hat: &[Z256; 256]) -> [Z256; 256] {
                 f[j] = t.add(f[j + len]);
 
                 // 10: f [ j + len] ← zeta · ( f [ j + len] − t)
-                f[j + len] = zeta.mul(f[j + len].sub(t));
+                f[j + len] = f[j + len].sub(t).mul_mont(zeta);
                 //
             } // 11: end for
         } // 12: end for
     } // 13: end for
 
     // 14: f ← f · 3303 mod q                   ▷ multiply every entry by 3303 ≡ 128^{−1} mod q
-    f.iter_mut().for_each(|item| *item = item.mul(Z256(3303)));
+    let f_mont = Z256(to_mont(3303));
+    f.iter_mut().for_each(|item| *item = item.mul_mont(f_mont));
 
-    // 15: return f
-    f
+    // 15: return f  (the input array now holds f)
 }
 
 
@@ -117,7 +112,7 @@ pub fn multiply_ntts(f_hat: &[Z256; 256], g_hat: &[Z256; 256]) -> [Z256; 256] {
             f_hat[2 * i + 1],
             g_hat[2 * i],
             g_hat[2 * i + 1],
-            Z256(ZETA_TABLE[i ^ 0x80]),
+            Z256(GAMMA_TABLE[i]),
         );
         h_hat[2 * i] = h_hat_2i;
         h_hat[2 * i + 1] = h_hat_2ip1;
@@ -166,17 +161,36 @@ const fn pow_mod_q(g: u32, e: u8) -> u16 {
     result as u16
 }
 
-#[allow(dead_code)]
+/// Converts a value mod q into Montgomery form, i.e. `x · 2^16 mod q`, for use with `Z256::mul_mont`.
+#[allow(clippy::cast_possible_truncation)]
+const fn to_mont(x: u16) -> u16 { ((x as u32) << 16).rem_euclid(Q) as u16 }
+
+/// Generates ζ^{BitRev7(k)} mod q for k in 0..128, i.e. the NTT/NTT^{-1} twiddles in the exact
+/// order the butterflies consume them (indexed directly by the k of Algorithms 8 and 9). The
+/// twiddles are stored in Montgomery form so the butterflies can use `Z256::mul_mont`.
+#[allow(clippy::cast_possible_truncation)]
+const fn gen_zeta_table() -> [u16; 128] {
+    let mut result = [0u16; 128];
+    let mut i = 0;
+    while i < 128u16 {
+        result[i as usize] = to_mont(pow_mod_q(ZETA, (i as u8).reverse_bits() >> 1));
+        i += 1;
+    }
+    result
+}
+
+/// Generates ζ^{2·BitRev7(i)+1} mod q for i in 0..128, i.e. the γ values of Algorithm 10 in
+/// the order `MultiplyNTTs` consumes them.
 #[allow(clippy::cast_possible_truncation)]
-const fn gen_zeta_table() -> [u16; 256] {
-    let mut result = [0u16; 256];
+const fn gen_gamma_table() -> [u16; 128] {
+    let mut result = [0u16; 128];
     let mut i = 0;
-    while i < 256u16 {
-        result[i as usize] = pow_mod_q(ZETA, (i as u8).reverse_bits());
+    while i < 128u16 {
+        result[i as usize] = pow_mod_q(ZETA, 2 * ((i as u8).reverse_bits() >> 1) + 1);
         i += 1;
     }
     result
 }
 
-#[allow(dead_code)]
-pub(crate) static ZETA_TABLE: [u16; 256] = gen_zeta_table();
+pub(crate) static ZETA_TABLE: [u16; 128] = gen_zeta_table();
+pub(crate) static GAMMA_TABLE: [u16; 128] = gen_gamma_table();
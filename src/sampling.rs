@@ -12,9 +12,14 @@ pub fn sample_ntt(mut byte_stream_b: impl XofReader) -> [Z256; 256] {
     // Input: byte stream B ∈ B^{∗}
     // Output: array a_hat ∈ Z^{256}_q              ▷ the coeffcients of the NTT of a polynomial
     let mut array_a_hat = [Z256(0); 256];
-    let mut bbb = [0u8; 3]; // Space for 3 random (byte) draws
+    // The first squeeze covers three full SHAKE128 blocks (rate 168), which yields the 256
+    // coefficients in all but ~1% of cases; any remainder is then drawn one block at a time.
+    let mut blocks = [0u8; 3 * 168];
+    byte_stream_b.read(&mut blocks);
+    let mut blocks_len = blocks.len();
 
-    // 1: i ← 0 (not needed as three bytes are repeatedly drawn from the rng bytestream via bbb)
+    // 1: i ← 0 (i indexes into the current blocks and triggers a refill when exhausted)
+    let mut i = 0;
 
     // 2: j ← 0
     let mut j = 0;
@@ -22,7 +27,12 @@ pub fn sample_ntt(mut byte_stream_b: impl XofReader) -> [Z256; 256] {
     // 3: while j < 256 do
     while j < 256 {
         //
-        byte_stream_b.read(&mut bbb); // Draw 3 bytes
+        if i == blocks_len {
+            byte_stream_b.read(&mut blocks[..168]); // Draw 56 x 3 more bytes
+            blocks_len = 168;
+            i = 0;
+        }
+        let bbb = &blocks[i..i + 3];
 
         // 4: d1 ← B[i] + 256 · (B[i + 1] mod 16)
         let d1 = u32::from(bbb[0]) + 256 * (u32::from(bbb[1]) & 0x0F);
@@ -33,8 +43,8 @@ pub fn sample_ntt(mut byte_stream_b: impl XofReader) -> [Z256; 256] {
         // 6: if d1 < q then
         if d1 < Q {
             //
-            // 7: a_hat[j] ← d1         ▷ a_hat ∈ Z256
-            array_a_hat[j] = Z256(u16::try_from(d1).unwrap());
+            // 7: a_hat[j] ← d1         ▷ a_hat ∈ Z256 (d1 < q, so the cast is lossless)
+            array_a_hat[j] = Z256(d1 as u16);
 
             // 8: j ← j+1
             j += 1;
@@ -45,14 +55,15 @@ pub fn sample_ntt(mut byte_stream_b: impl XofReader) -> [Z256; 256] {
         if (d2 < Q) & (j < 256) {
             //
             // 11: a_hat[j] ← d2
-            array_a_hat[j] = Z256(u16::try_from(d2).unwrap());
+            array_a_hat[j] = Z256(d2 as u16);
 
             // 12: j ← j+1
             j += 1;
             //
         } // 13: end if
 
-        // 14: i ← i+3  (not needed as we draw 3 more bytes next time
+        // 14: i ← i+3
+        i += 3;
     } // 15: end while
 
     array_a_hat // 16: return a_hat
@@ -61,8 +72,10 @@ pub fn sample_ntt(mut byte_stream_b: impl XofReader) -> [Z256; 256] {
 
 /// Algorithm 7 `SamplePolyCBDη(B)` on page 20.
 /// If the input is a stream of uniformly random bytes, outputs a sample from the distribution Dη (Rq ).
+/// The parameter η is a const generic so the bit masks and shifts below are fixed at compile time.
 #[allow(clippy::unnecessary_wraps)]  // TODO: revisit
-pub fn sample_poly_cbd(eta: u32, byte_array_b: &[u8]) -> Result<[Z256; 256], &'static str> {
+pub fn sample_poly_cbd<const ETA: usize>(byte_array_b: &[u8]) -> Result<[Z256; 256], &'static str> {
+    let mask = (1u64 << ETA) - 1;
     let mut array_f: [Z256; 256] = [Z256(0); 256];
     let mut temp = 0;
     let mut int_index = 0;
@@ -70,14 +83,12 @@ pub fn sample_poly_cbd(eta: u32, byte_array_b: &[u8]) -> Result<[Z256; 256], &'s
     for byte in byte_array_b {
         temp |= (*byte as u64) << bit_index;
         bit_index += 8;
-        while bit_index >= 2 * (eta as usize) {
-            let tmask_x = temp & (2u64.pow(eta) - 1);
-            let x = (tmask_x as u8).count_ones();
-            let tmask_y = (temp >> eta) & (2u64.pow(eta) - 1);
-            let y = (tmask_y as u8).count_ones();
+        while bit_index >= 2 * ETA {
+            let x = (temp & mask).count_ones();
+            let y = ((temp >> ETA) & mask).count_ones();
             array_f[int_index] = Z256(x as u16).sub(Z256(y as u16));
-            bit_index -= 2 * (eta as usize);
-            temp >>= 2 * (eta as usize);
+            bit_index -= 2 * ETA;
+            temp >>= 2 * ETA;
             int_index += 1;
         }
     }
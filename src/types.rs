@@ -3,7 +3,7 @@ use crate::Q;
 // While Z256 is nice, simple and correct, the performance is atrocious.
 // This will be addressed (particularly in matrix operations etc).
 
-/// Stored as u16, but arithmetic as u32 (so we can multiply/reduce/etc)
+/// Stored as u16, but arithmetic as i16/i32/u64 (so we can multiply/reduce/etc)
 #[derive(Clone, Copy)]
 pub struct Z256(pub u16);
 
@@ -13,23 +13,40 @@ impl Z256 {
     #[allow(clippy::cast_possible_truncation)]
     const Q16: u16 = Q as u16;
     const Q64: u64 = Q as u64;
+    /// Q^{-1} mod 2^16, as a signed 16-bit value (Q · QINV16 ≡ 1 mod 2^16)
+    const QINV16: i16 = -3327;
 
     pub fn get_u16(self) -> u16 { self.0 }
 
+    // Both operands are < Q < 2^12, so sums and differences fit comfortably in an i16; the final
+    // correction is applied branch-free by masking Q with the sign bit of the intermediate result.
     #[inline(always)]
+    #[allow(clippy::cast_possible_wrap, clippy::cast_sign_loss)]
     pub fn add(self, other: Self) -> Self {
-        let sum = self.0.wrapping_add(other.0);
-        let (trial, borrow) = sum.overflowing_sub(Self::Q16);
-        let result = if borrow { sum } else { trial }; // Not quite CT
-        Self(result)
+        let trial = (self.0 + other.0) as i16 - Self::Q16 as i16;
+        let result = trial + ((trial >> 15) & Self::Q16 as i16);
+        Self(result as u16)
     }
 
     #[inline(always)]
+    #[allow(clippy::cast_possible_wrap, clippy::cast_sign_loss)]
     pub fn sub(self, other: Self) -> Self {
-        let (diff, borrow) = self.0.overflowing_sub(other.0);
-        let trial = diff.wrapping_add(Self::Q16);
-        let result = if borrow { trial } else { diff }; // Not quite CT
-        Self(result)
+        let diff = self.0 as i16 - other.0 as i16;
+        let result = diff + ((diff >> 15) & Self::Q16 as i16);
+        Self(result as u16)
+    }
+
+    /// Montgomery multiplication (R = 2^16) by a constant `c_mont` that is already in Montgomery
+    /// form, i.e. `c · 2^16 mod Q`. Returns `self · c mod Q` using a single 16x16->32-bit product
+    /// and 16-bit reductions (vs. the 64-bit Barrett reduction in `mul`).
+    #[inline(always)]
+    #[allow(clippy::cast_possible_wrap, clippy::cast_sign_loss)]
+    pub fn mul_mont(self, c_mont: Self) -> Self {
+        let prod = i32::from(self.0) * i32::from(c_mont.0); // < Q^2 < Q · 2^15
+        let t = (prod as i16).wrapping_mul(Self::QINV16); // t ≡ prod · Q^{-1} mod 2^16
+        let result = ((prod - i32::from(t) * Q as i32) >> 16) as i16; // in (-Q, Q)
+        let result = result + ((result >> 15) & Self::Q16 as i16);
+        Self(result as u16)
     }
 
     #[inline(always)]
@@ -40,6 +57,7 @@ impl Z256 {
         let rem = prod - quot * Self::Q64;
         let (diff, borrow) = rem.overflowing_sub(Self::Q64);
         let result = if borrow { rem } else { diff }; // Not quite CT
-        Self(u16::try_from(result).unwrap())
+        debug_assert!(result < Self::Q64);
+        Self(result as u16) // result < Q, so no checked conversion (and panic path) is needed
     }
 }
@@ -1,14 +1,15 @@
-use std::fs;
-use std::io::Read;
+use std::fs::File;
+use std::io::{BufRead, BufReader};
+use std::sync::Mutex;
+use std::thread;
 
 use hex::decode;
-use regex::Regex;
 
 use fips203::{ml_kem_1024, ml_kem_512, ml_kem_768};
 use fips203::traits::{Decaps, Encaps, KeyGen, SerDes};
 use flate2::read::GzDecoder;
 
-use super::TestRng;
+use super::{HexValues, TestRng};
 
 // Note: test vectors are directly copied across from https://github.com/C2SP/CCTV/tree/fd8cecee5f7746d0c6b8c3f4530c8976d629cbfa
 // This approach may improve in future..
@@ -22,21 +23,9 @@ use super::TestRng;
 fn get_intermediate_vec(
     filename: &str,
 ) -> (Vec<u8>, Vec<u8>, Vec<u8>, Vec<u8>, Vec<u8>, Vec<u8>, Vec<u8>) {
-    let data = fs::read_to_string(filename).expect("Unable to read file");
-    let z_regex = Regex::new(r"z = ([0-9a-fA-F]+)").unwrap();
-    let z = decode(z_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let d_regex = Regex::new(r"d = ([0-9a-fA-F]+)").unwrap();
-    let d = decode(d_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let ek_regex = Regex::new(r"ek = ([0-9a-fA-F]+)").unwrap();
-    let ek_exp = decode(ek_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let dk_regex = Regex::new(r"dk = ([0-9a-fA-F]+)").unwrap();
-    let dk_exp = decode(dk_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let m_regex = Regex::new(r"m = ([0-9a-fA-F]+)").unwrap();
-    let m = decode(m_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let k_regex = Regex::new(r"K = ([0-9a-fA-F]+)").unwrap();
-    let k_exp = decode(k_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let c_regex = Regex::new(r"c = ([0-9a-fA-F]+)").unwrap();
-    let c_exp = decode(c_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
+    let values = HexValues::from_file(filename, " = ");
+    let (d, z, ek_exp, dk_exp) = (values.get("d"), values.get("z"), values.get("ek"), values.get("dk"));
+    let (m, k_exp, c_exp) = (values.get("m"), values.get("K"), values.get("c"));
 
     (d, z, ek_exp, dk_exp, m, k_exp, c_exp)
 }
@@ -96,15 +85,8 @@ pub fn test_intermediate_1024() {
 }
 
 fn get_strcmp_vec(filename: &str) -> (Vec<u8>, Vec<u8>, Vec<u8>) {
-    let data = fs::read_to_string(filename).expect("Unable to read file");
-    let dk_regex = Regex::new(r"dk = ([0-9a-fA-F]+)").unwrap();
-    let dk_exp = decode(dk_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let k_regex = Regex::new(r"K = ([0-9a-fA-F]+)").unwrap();
-    let k_exp = decode(k_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let c_regex = Regex::new(r"c = ([0-9a-fA-F]+)").unwrap();
-    let c_exp = decode(c_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-
-    (dk_exp, k_exp, c_exp)
+    let values = HexValues::from_file(filename, " = ");
+    (values.get("dk"), values.get("K"), values.get("c"))
 }
 
 #[test]
@@ -191,41 +173,40 @@ pub fn test_unlucky_1024() {
     assert_eq!(k1_act, k2_act);
 }
 
+// Each modulus vector is an independent (invalid) encaps key, so the lines are checked on all
+// available cores. The gzip file is streamed: workers pull one decompressed line at a time from a
+// shared reader, so neither the compressed nor the decompressed file is ever held in memory.
+fn check_modulus(filename: &str, is_rejected: fn(Vec<u8>) -> bool) {
+    let gz = File::open(filename).unwrap();
+    let lines = Mutex::new(BufReader::new(GzDecoder::new(gz)).lines());
+    let threads = thread::available_parallelism().map_or(1, usize::from);
+    thread::scope(|scope| {
+        for _ in 0..threads {
+            scope.spawn(|| loop {
+                let Some(line) = lines.lock().unwrap().next() else { break };
+                assert!(is_rejected(decode(line.unwrap()).unwrap()));
+            });
+        }
+    });
+}
+
 #[test]
 fn test_modulus_512() {
-    let gz = fs::read("./tests/cctv_vectors/ML-KEM/modulus/ML-KEM-512.txt.gz").unwrap();
-    let mut d = GzDecoder::new(&gz[..]);
-    let mut s = String::new();
-    d.read_to_string(&mut s).unwrap();
-    for line in s.lines() {
-        let ek_bytes = decode(line).unwrap();
-        let ek = ml_kem_512::EncapsKey::try_from_bytes(ek_bytes.try_into().unwrap());
-        assert!(ek.is_err())
-    }
+    check_modulus("./tests/cctv_vectors/ML-KEM/modulus/ML-KEM-512.txt.gz", |ek_bytes| {
+        ml_kem_512::EncapsKey::try_from_bytes(ek_bytes.try_into().unwrap()).is_err()
+    });
 }
 
 #[test]
 fn test_modulus_768() {
-    let gz = fs::read("./tests/cctv_vectors/ML-KEM/modulus/ML-KEM-768.txt.gz").unwrap();
-    let mut d = GzDecoder::new(&gz[..]);
-    let mut s = String::new();
-    d.read_to_string(&mut s).unwrap();
-    for line in s.lines() {
-        let ek_bytes = decode(line).unwrap();
-        let ek = ml_kem_768::EncapsKey::try_from_bytes(ek_bytes.try_into().unwrap());
-        assert!(ek.is_err())
-    }
+    check_modulus("./tests/cctv_vectors/ML-KEM/modulus/ML-KEM-768.txt.gz", |ek_bytes| {
+        ml_kem_768::EncapsKey::try_from_bytes(ek_bytes.try_into().unwrap()).is_err()
+    });
 }
 
 #[test]
 fn test_modulus_1024() {
-    let gz = fs::read("./tests/cctv_vectors/ML-KEM/modulus/ML-KEM-1024.txt.gz").unwrap();
-    let mut d = GzDecoder::new(&gz[..]);
-    let mut s = String::new();
-    d.read_to_string(&mut s).unwrap();
-    for line in s.lines() {
-        let ek_bytes = decode(line).unwrap();
-        let ek = ml_kem_1024::EncapsKey::try_from_bytes(ek_bytes.try_into().unwrap());
-        assert!(ek.is_err())
-    }
+    check_modulus("./tests/cctv_vectors/ML-KEM/modulus/ML-KEM-1024.txt.gz", |ek_bytes| {
+        ml_kem_1024::EncapsKey::try_from_bytes(ek_bytes.try_into().unwrap()).is_err()
+    });
 }
@@ -86,3 +86,20 @@ fn test_expected_flow_1024() {
         assert_eq!(bob_ssk_bytes, alice_ssk_bytes)
     }
 }
+
+#[test]
+fn test_types_are_send_and_sync() {
+    // Keys, ciphertexts and secrets are plain byte arrays, so callers can shard keygen/encaps/decaps
+    // across threads without any locking; keep it that way.
+    fn assert_send_sync<T: Send + Sync>() {}
+    assert_send_sync::<ml_kem_512::EncapsKey>();
+    assert_send_sync::<ml_kem_512::DecapsKey>();
+    assert_send_sync::<ml_kem_512::CipherText>();
+    assert_send_sync::<ml_kem_768::EncapsKey>();
+    assert_send_sync::<ml_kem_768::DecapsKey>();
+    assert_send_sync::<ml_kem_768::CipherText>();
+    assert_send_sync::<ml_kem_1024::EncapsKey>();
+    assert_send_sync::<ml_kem_1024::DecapsKey>();
+    assert_send_sync::<ml_kem_1024::CipherText>();
+    assert_send_sync::<fips203::SharedSecretKey>();
+}
@@ -1,15 +1,13 @@
 // This file implements a variety of top-level tests, including: official vectors, random
 // round trips, and (soon) fails.
 
-use std::fs;
-
-use hex::decode;
 use rand_core::{CryptoRng, RngCore};
-use regex::Regex;
 
 use fips203::{ml_kem_1024, ml_kem_512, ml_kem_768};
 use fips203::traits::{Decaps, Encaps, KeyGen, SerDes};
 
+use super::HexValues;
+
 // ----- CUSTOM RNG TO REPLAY VALUES -----
 
 struct MyRng {
@@ -47,48 +45,18 @@ impl MyRng {
 // ----- EXTRACT I/O VALUES FROM OFFICIAL VECTORS -----
 
 fn get_keygen_vec(filename: &str) -> (Vec<u8>, Vec<u8>, Vec<u8>, Vec<u8>) {
-    let data = fs::read_to_string(filename).expect("Unable to read file");
-    let z_regex = Regex::new(r"z: ([0-9a-fA-F]+)").unwrap();
-    let z = decode(z_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let d_regex = Regex::new(r"d: ([0-9a-fA-F]+)").unwrap();
-    let d = decode(d_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let ek_regex = Regex::new(r"ek: ([0-9a-fA-F]+)").unwrap();
-    let ek_exp = decode(ek_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let dk_regex = Regex::new(r"dk: ([0-9a-fA-F]+)").unwrap();
-    let dk_exp = decode(dk_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    (d, z, ek_exp, dk_exp)
+    let values = HexValues::from_file(filename, ": ");
+    (values.get("d"), values.get("z"), values.get("ek"), values.get("dk"))
 }
 
 fn get_encaps_vec(filename: &str) -> (Vec<u8>, Vec<u8>, Vec<u8>, Vec<u8>) {
-    let data = fs::read_to_string(filename).expect("Unable to read file");
-    let ek_regex = Regex::new(r"ek: ([0-9a-fA-F]+)").unwrap();
-    let ek = decode(ek_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let m_regex = Regex::new(r"m: ([0-9a-fA-F]+)").unwrap();
-    let m = decode(m_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let ssk_regex = Regex::new(r"K: ([0-9a-fA-F]+)").unwrap();
-    let ssk = decode(ssk_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let ct_regex = Regex::new(r"c: ([0-9a-fA-F]+)").unwrap();
-    let ct = decode(ct_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    (ek, m, ssk, ct)
+    let values = HexValues::from_file(filename, ": ");
+    (values.get("ek"), values.get("m"), values.get("K"), values.get("c"))
 }
 
 fn get_decaps_vec(filename: &str) -> (Vec<u8>, Vec<u8>, Vec<u8>) {
-    let data = fs::read_to_string(filename).expect("Unable to read file");
-    let dk_regex = Regex::new(r"dk: ([0-9a-fA-F]+)").unwrap();
-    let dk = decode(dk_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let c_regex = Regex::new(r"c: ([0-9a-fA-F]+)").unwrap();
-    let c = decode(c_regex.captures(&data).unwrap().get(1).unwrap().as_str()).unwrap();
-    let kprime_regex = Regex::new(r"KPrime: ([0-9a-fA-F]+)").unwrap();
-    let kprime = decode(
-        kprime_regex
-            .captures(&data)
-            .unwrap()
-            .get(1)
-            .unwrap()
-            .as_str(),
-    )
-        .unwrap();
-    (dk, c, kprime)
+    let values = HexValues::from_file(filename, ": ");
+    (values.get("dk"), values.get("c"), values.get("KPrime"))
 }
 
 
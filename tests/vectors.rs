@@ -1,7 +1,12 @@
 // This file implements a variety of top-level tests, including: official vectors, random
 // round trips, and (soon) fails.
 
+use std::collections::HashMap;
+use std::fs;
+
+use hex::decode;
 use rand_core::{CryptoRng, RngCore};
+use regex::Regex;
 
 mod cctv_vectors;
 mod nist_vectors;
@@ -38,3 +43,26 @@ impl TestRng {
         self.data.push(x);
     }
 }
+
+
+// ----- EXTRACT HEX VALUES FROM VECTOR FILES -----
+
+// Collects every `<name><sep><hex>` line of a vector file in one pass with a single regex (rather
+// than compiling and running a regex per field); values are decoded as they are looked up.
+struct HexValues(HashMap<String, String>);
+
+impl HexValues {
+    fn from_file(filename: &str, sep: &str) -> Self {
+        let data = fs::read_to_string(filename).expect("Unable to read file");
+        let line_regex = Regex::new(&format!(r"(?m)^(\w+){sep}([0-9a-fA-F]+)[ \t\r]*$")).unwrap();
+        let mut values = HashMap::new();
+        for caps in line_regex.captures_iter(&data) {
+            values.entry(caps[1].to_string()).or_insert_with(|| caps[2].to_string()); // first wins
+        }
+        HexValues(values)
+    }
+
+    fn get(&self, name: &str) -> Vec<u8> {
+        decode(self.0.get(name).expect("Missing vector value")).unwrap()
+    }
+}